@@ -1,11 +1,12 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.orm import joinedload
 
 from app.core.security import decode_token
 from app.db.session import get_db
-from app.db.models import User
+from app.db.models import User, Profile
 
 bearer = HTTPBearer()
 
@@ -18,8 +19,18 @@ async def get_current_user(
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    result = await db.execute(select(User).where(User.id == user_id))
+    # Profile is needed by most endpoints — load it in the same query.
+    # lambda_stmt caches the statement construction across requests.
+    result = await db.execute(
+        lambda_stmt(lambda: select(User).options(joinedload(User.profile)).where(User.id == user_id))
+    )
     user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
+
+
+async def get_current_profile(current_user: User = Depends(get_current_user)) -> Profile:
+    if not current_user.profile:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Profile required")
+    return current_user.profile
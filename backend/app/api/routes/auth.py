@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
+from sqlalchemy.exc import IntegrityError
 
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import hash_password_async, verify_password_async, create_access_token
 from app.db.session import get_db
 from app.db.models import User
 from app.schemas.auth import RegisterRequest, LoginRequest, TokenResponse
@@ -12,23 +13,28 @@ router = APIRouter()
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 async def register(body: RegisterRequest, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(User).where(User.email == body.email))
-    if result.scalar_one_or_none():
+    # The unique email index is the existence check — no SELECT on the happy path
+    try:
+        result = await db.execute(
+            insert(User)
+            .values(email=body.email, password_hash=await hash_password_async(body.password))
+            .returning(User)
+        )
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
-
-    user = User(email=body.email, password_hash=hash_password(body.password))
-    db.add(user)
+    user = result.scalar_one()
     await db.commit()
-    await db.refresh(user)
     return TokenResponse(access_token=create_access_token(user.id))
 
 
 @router.post("/login", response_model=TokenResponse)
 async def login(body: LoginRequest, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(User).where(User.email == body.email))
-    user = result.scalar_one_or_none()
+    # Only the id and hash are needed — skip materializing a full User
+    result = await db.execute(select(User.id, User.password_hash).where(User.email == body.email))
+    user = result.first()
 
-    if not user or not verify_password(body.password, user.password_hash):
+    if not user or not await verify_password_async(body.password, user.password_hash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     return TokenResponse(access_token=create_access_token(user.id))
@@ -1,10 +1,11 @@
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_current_profile
 from app.db.session import get_db
 from app.db.models import User, Profile, DailyLog, FoodEntry, ExerciseEntry
 from app.schemas.daily import (
@@ -16,43 +17,51 @@ from app.services.daily import get_or_create_daily_log, calculate_status, estima
 
 router = APIRouter()
 
-
-async def _require_profile(db: AsyncSession, user_id: int) -> Profile:
-    result = await db.execute(select(Profile).where(Profile.user_id == user_id))
-    profile = result.scalar_one_or_none()
-    if not profile:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Profile required")
-    return profile
+# Built once at import; rows from the DB are trusted, so they're serialized
+# straight to JSON by pydantic-core instead of going through FastAPI's
+# response validation + jsonable_encoder.
+_HISTORY_ADAPTER = TypeAdapter(list[DailySummary])
 
 
 @router.get("", response_model=DailyLogResponse)
 async def get_today(
     current_user: User = Depends(get_current_user),
+    profile: Profile = Depends(get_current_profile),
     db: AsyncSession = Depends(get_db),
 ):
-    await _require_profile(db, current_user.id)
-    log = await get_or_create_daily_log(db, current_user.id, date.today())
-    return log
+    log = await get_or_create_daily_log(db, current_user.id, date.today(), profile.daily_target)
+    body = DailyLogResponse.model_validate(log).model_dump_json(by_alias=True)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/food", response_model=FoodEntryResponse, status_code=status.HTTP_201_CREATED)
 async def add_food(
     body: FoodEntryCreate,
     current_user: User = Depends(get_current_user),
+    profile: Profile = Depends(get_current_profile),
     db: AsyncSession = Depends(get_db),
 ):
-    profile = await _require_profile(db, current_user.id)
-    log = await get_or_create_daily_log(db, current_user.id, date.today())
-
-    entry = FoodEntry(daily_log_id=log.id, **body.model_dump())
-    db.add(entry)
+    log = await get_or_create_daily_log(db, current_user.id, date.today(), profile.daily_target)
 
-    log.total_consumed = round(log.total_consumed + body.calories, 2)
-    log.net_calories = round(log.total_consumed - log.total_burned, 2)
-    log.status = calculate_status(log.net_calories, profile.daily_target)
+    # INSERT ... RETURNING gives back server defaults without a refresh SELECT
+    result = await db.execute(
+        insert(FoodEntry).values(daily_log_id=log.id, **body.model_dump()).returning(FoodEntry)
+    )
+    entry = result.scalar_one()
+
+    total_consumed = round(log.total_consumed + body.calories, 2)
+    net_calories = round(total_consumed - log.total_burned, 2)
+    await db.execute(
+        update(DailyLog)
+        .where(DailyLog.id == log.id)
+        .values(
+            total_consumed=total_consumed,
+            net_calories=net_calories,
+            status=calculate_status(net_calories, profile.daily_target),
+        )
+    )
 
     await db.commit()
-    await db.refresh(entry)
     return entry
 
 
@@ -60,28 +69,39 @@ async def add_food(
 async def add_exercise(
     body: ExerciseEntryCreate,
     current_user: User = Depends(get_current_user),
+    profile: Profile = Depends(get_current_profile),
     db: AsyncSession = Depends(get_db),
 ):
-    profile = await _require_profile(db, current_user.id)
-    log = await get_or_create_daily_log(db, current_user.id, date.today())
+    log = await get_or_create_daily_log(db, current_user.id, date.today(), profile.daily_target)
 
     # Calculate calories burned using MET × weight × (duration / 60)
     calories_burned = estimate_exercise_calories(body.type, body.duration_min, profile.weight)
 
-    entry = ExerciseEntry(
-        daily_log_id=log.id,
-        type=body.type,
-        duration=body.duration_min,
-        calories_burned=calories_burned,
+    result = await db.execute(
+        insert(ExerciseEntry)
+        .values(
+            daily_log_id=log.id,
+            type=body.type,
+            duration=body.duration_min,
+            calories_burned=calories_burned,
+        )
+        .returning(ExerciseEntry)
+    )
+    entry = result.scalar_one()
+
+    total_burned = round(log.total_burned + calories_burned, 2)
+    net_calories = round(log.total_consumed - total_burned, 2)
+    await db.execute(
+        update(DailyLog)
+        .where(DailyLog.id == log.id)
+        .values(
+            total_burned=total_burned,
+            net_calories=net_calories,
+            status=calculate_status(net_calories, profile.daily_target),
+        )
     )
-    db.add(entry)
-
-    log.total_burned = round(log.total_burned + calories_burned, 2)
-    log.net_calories = round(log.total_consumed - log.total_burned, 2)
-    log.status = calculate_status(log.net_calories, profile.daily_target)
 
     await db.commit()
-    await db.refresh(entry)
     return entry
 
 
@@ -89,21 +109,19 @@ async def add_exercise(
 async def delete_food(
     entry_id: int,
     current_user: User = Depends(get_current_user),
+    profile: Profile = Depends(get_current_profile),
     db: AsyncSession = Depends(get_db),
 ):
-    profile = await _require_profile(db, current_user.id)
-
+    # Fetch the entry and its owning log in one round trip
     result = await db.execute(
-        select(FoodEntry)
-        .join(DailyLog)
+        select(FoodEntry, DailyLog)
+        .join(DailyLog, FoodEntry.daily_log_id == DailyLog.id)
         .where(FoodEntry.id == entry_id, DailyLog.user_id == current_user.id)
     )
-    entry = result.scalar_one_or_none()
-    if not entry:
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
-
-    log_result = await db.execute(select(DailyLog).where(DailyLog.id == entry.daily_log_id))
-    log = log_result.scalar_one()
+    entry, log = row
 
     log.total_consumed = round(max(log.total_consumed - entry.calories, 0), 2)
     log.net_calories = round(log.total_consumed - log.total_burned, 2)
@@ -118,9 +136,18 @@ async def get_history(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    # DailySummary only needs scalar columns — skip loading full ORM objects
     result = await db.execute(
-        select(DailyLog)
+        select(
+            DailyLog.date,
+            DailyLog.total_consumed,
+            DailyLog.total_burned,
+            DailyLog.net_calories,
+            DailyLog.status,
+        )
         .where(DailyLog.user_id == current_user.id)
         .order_by(DailyLog.date.desc())
     )
-    return result.scalars().all()
+    # Columns are already the right types — construct without re-validating
+    rows = [DailySummary.model_construct(**row._mapping) for row in result]
+    return Response(content=_HISTORY_ADAPTER.dump_json(rows), media_type="application/json")
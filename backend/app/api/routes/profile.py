@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.api.deps import get_current_user
 from app.db.session import get_db
@@ -17,34 +19,39 @@ async def create_profile(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Profile).where(Profile.user_id == current_user.id))
-    if result.scalar_one_or_none():
+    if current_user.profile:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Profile already exists")
 
     bmr = calculate_bmr(body.height, body.weight, body.age, body.gender)
     tdee = calculate_tdee(bmr, body.activity_level)
     daily_target = calculate_daily_target(tdee, body.goal)
 
-    profile = Profile(
-        user_id=current_user.id,
-        **body.model_dump(),
-        bmr=bmr,
-        tdee=tdee,
-        daily_target=daily_target,
-    )
-    db.add(profile)
+    try:
+        result = await db.execute(
+            insert(Profile)
+            .values(
+                user_id=current_user.id,
+                **body.model_dump(),
+                bmr=bmr,
+                tdee=tdee,
+                daily_target=daily_target,
+            )
+            .returning(Profile)
+        )
+    except IntegrityError:
+        # Lost a race with a concurrent create for the same user
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Profile already exists")
+    profile = result.scalar_one()
+    # Keep the joinedloaded relationship in sync for the rest of the session
+    set_committed_value(current_user, "profile", profile)
     await db.commit()
-    await db.refresh(profile)
     return profile
 
 
 @router.get("", response_model=ProfileResponse)
-async def get_profile(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-):
-    result = await db.execute(select(Profile).where(Profile.user_id == current_user.id))
-    profile = result.scalar_one_or_none()
-    if not profile:
+async def get_profile(current_user: User = Depends(get_current_user)):
+    # Already loaded alongside the user by get_current_user — no extra query
+    if not current_user.profile:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
-    return profile
+    return current_user.profile
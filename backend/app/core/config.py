@@ -9,6 +9,16 @@ class Settings(BaseSettings):
     JWT_EXPIRE_MINUTES: int = 10080  # 7 days
     ENV: str = "development"
 
+    # Connection pool — tune per deployment
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_ECHO: bool = False
+    DB_PGBOUNCER: bool = False  # disable asyncpg statement cache behind PgBouncer
+    # Postgres only: ack COMMIT before the WAL fsync. A crash may lose the last
+    # few hundred ms of writes, but never leaves them half-applied.
+    DB_SYNCHRONOUS_COMMIT: bool = True
+
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
     def fix_db_scheme(cls, v: str) -> str:
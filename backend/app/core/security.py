@@ -1,7 +1,9 @@
-from datetime import datetime, timedelta
+import asyncio
+import time
+from functools import lru_cache
 from typing import Optional
 
-from jose import jwt, JWTError
+import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
@@ -17,15 +19,39 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+# bcrypt is CPU-bound — run it in a worker thread so it doesn't block the event loop
+async def hash_password_async(password: str) -> str:
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await asyncio.to_thread(pwd_context.verify, plain, hashed)
+
+
+_TOKEN_TTL_SECONDS = settings.JWT_EXPIRE_MINUTES * 60
+
+
 def create_access_token(user_id: int) -> str:
-    expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
-    payload = {"sub": str(user_id), "exp": expire}
+    payload = {"sub": str(user_id), "exp": int(time.time()) + _TOKEN_TTL_SECONDS}
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
-def decode_token(token: str) -> Optional[int]:
+@lru_cache(maxsize=8192)
+def _decode_claims(token: str) -> Optional[tuple[int, int]]:
+    """Verify the signature once per token and remember (user_id, exp)."""
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-        return int(payload["sub"])
-    except JWTError:
+        return int(payload["sub"]), int(payload["exp"])
+    except jwt.PyJWTError:
+        return None
+
+
+def decode_token(token: str) -> Optional[int]:
+    claims = _decode_claims(token)
+    if claims is None:
+        return None
+    user_id, exp = claims
+    # Cached claims outlive the decode call, so expiry is re-checked every time
+    if exp <= time.time():
         return None
+    return user_id
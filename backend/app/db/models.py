@@ -89,7 +89,7 @@ class FoodEntry(Base):
     __tablename__ = "food_entries"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    daily_log_id: Mapped[int] = mapped_column(Integer, ForeignKey("daily_logs.id"), nullable=False)
+    daily_log_id: Mapped[int] = mapped_column(Integer, ForeignKey("daily_logs.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     calories: Mapped[float] = mapped_column(Float, nullable=False)
     input_type: Mapped[InputType] = mapped_column(SAEnum(InputType), nullable=False)
@@ -102,7 +102,7 @@ class ExerciseEntry(Base):
     __tablename__ = "exercise_entries"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    daily_log_id: Mapped[int] = mapped_column(Integer, ForeignKey("daily_logs.id"), nullable=False)
+    daily_log_id: Mapped[int] = mapped_column(Integer, ForeignKey("daily_logs.id"), nullable=False, index=True)
     type: Mapped[str] = mapped_column(String, nullable=False)
     duration: Mapped[int] = mapped_column(Integer, nullable=False)  # minutes
     calories_burned: Mapped[float] = mapped_column(Float, nullable=False)
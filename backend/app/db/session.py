@@ -1,9 +1,27 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.ENV == "development")
+connect_args = {}
+if settings.DB_PGBOUNCER:
+    connect_args["statement_cache_size"] = 0
+if not settings.DB_SYNCHRONOUS_COMMIT:
+    connect_args["server_settings"] = {"synchronous_commit": "off"}
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # Recycle stale connections instead of pinging on every checkout
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=False,
+    connect_args=connect_args,
+    query_cache_size=1200,
+)
 
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
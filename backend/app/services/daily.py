@@ -1,8 +1,14 @@
 from datetime import date
+from math import floor
+from types import MappingProxyType
+from typing import Mapping
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.models import DailyLog, DailyStatus
 
@@ -10,7 +16,7 @@ from app.db.models import DailyLog, DailyStatus
 # Source: Compendium of Physical Activities (Ainsworth et al., 2011)
 # https://sites.google.com/site/compendiumofphysicalactivities/
 # Formula: kcal = MET × weight_kg × (duration_min / 60)
-MET_VALUES: dict[str, float] = {
+_MET_RAW: dict[str, float] = {
     "walking_slow": 2.8,            # <3.2 km/h
     "walking": 3.5,                 # moderate ~5 km/h
     "walking_fast": 4.3,            # brisk ~6 km/h
@@ -40,51 +46,75 @@ MET_VALUES: dict[str, float] = {
     "other": 4.0,                   # conservative general estimate
 }
 
+# Read-only public view; lookups go through the raw dict's bound .get
+MET_VALUES: Mapping[str, float] = MappingProxyType(_MET_RAW)
+_MET_GET = _MET_RAW.get
+_MET_DEFAULT = _MET_RAW["other"]
+
 
 def estimate_exercise_calories(exercise_type: str, duration_min: int, weight_kg: float) -> float:
     """
     Estimate kcal burned using the MET formula.
     kcal = MET × weight_kg × (duration_min / 60)
     """
-    met = MET_VALUES.get(exercise_type, MET_VALUES["other"])
-    return round(met * weight_kg * (duration_min / 60), 1)
+    kcal = _MET_GET(exercise_type, _MET_DEFAULT) * weight_kg * duration_min / 60.0
+    # Round half-up to 0.1 kcal with plain arithmetic — cheaper than round(x, 1)
+    return floor(kcal * 10.0 + 0.5) / 10.0
 
 
-async def get_or_create_daily_log(db: AsyncSession, user_id: int, log_date: date) -> DailyLog:
-    """Return today's log, creating it if it doesn't exist. Idempotent."""
-    result = await db.execute(
-        select(DailyLog)
+def _daily_log_stmt(user_id: int, log_date: date):
+    return lambda_stmt(
+        lambda: select(DailyLog)
         .options(
             selectinload(DailyLog.food_entries),
             selectinload(DailyLog.exercise_entries),
+            # Any other relationship access is an unplanned N+1 — fail loudly
+            raiseload("*"),
         )
         .where(DailyLog.user_id == user_id, DailyLog.date == log_date)
     )
+
+
+async def get_or_create_daily_log(
+    db: AsyncSession, user_id: int, log_date: date, daily_target: float
+) -> DailyLog:
+    """Return today's log, creating it if it doesn't exist. Idempotent.
+
+    A new log starts at 0 net kcal, so its status is classified against the
+    user's target rather than left at the column default.
+    """
+    result = await db.execute(_daily_log_stmt(user_id, log_date))
     log = result.scalar_one_or_none()
     if log:
         return log
 
-    log = DailyLog(user_id=user_id, date=log_date)
-    db.add(log)
-    await db.commit()
-
-    # Re-fetch with eager-loaded relationships
+    # ON CONFLICT on uq_user_date makes concurrent first requests of the day
+    # race-safe: the loser's INSERT is a no-op and both re-fetch the same row.
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
     result = await db.execute(
-        select(DailyLog)
-        .options(
-            selectinload(DailyLog.food_entries),
-            selectinload(DailyLog.exercise_entries),
-        )
-        .where(DailyLog.id == log.id)
+        insert(DailyLog)
+        .values(user_id=user_id, date=log_date, status=calculate_status(0.0, daily_target))
+        .on_conflict_do_nothing(index_elements=["user_id", "date"])
+        .returning(DailyLog)
     )
+    log = result.scalar_one_or_none()
+    await db.commit()
+    if log:
+        # A freshly inserted log has no entries — no need to load them
+        set_committed_value(log, "food_entries", [])
+        set_committed_value(log, "exercise_entries", [])
+        return log
+
+    # Another request created it first — fetch theirs with eager-loaded relationships
+    result = await db.execute(_daily_log_stmt(user_id, log_date))
     return result.scalar_one()
 
 
+# Indexed by (diff > 100) - (diff < -100) + 1
+_STATUS_BY_SIGN = (DailyStatus.deficit, DailyStatus.maintenance, DailyStatus.surplus)
+
+
 def calculate_status(net_calories: float, daily_target: float) -> DailyStatus:
     """±100 kcal tolerance around target = maintenance."""
     diff = net_calories - daily_target
-    if diff < -100:
-        return DailyStatus.deficit
-    if diff > 100:
-        return DailyStatus.surplus
-    return DailyStatus.maintenance
+    return _STATUS_BY_SIGN[(diff > 100) - (diff < -100) + 1]
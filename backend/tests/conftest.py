@@ -1,40 +1,111 @@
+import asyncio
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.core.security import create_access_token, hash_password
 from app.db.base import Base
+from app.db.models import User, Profile, Gender, ActivityLevel, Goal
 from app.db.session import get_db
+from app.services.bmr import calculate_bmr, calculate_tdee, calculate_daily_target
+
+@pytest.fixture(scope="session")
+def event_loop():
+    # One loop for the whole run instead of a fresh loop per test
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+# StaticPool keeps the single in-memory connection alive and shared, so every
+# session sees the same database — no disk I/O or fsync on commit
+engine = create_async_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+    echo=False,
+)
 
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
-engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-TestSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# The sqlite driver manages transactions itself and silently breaks SAVEPOINTs.
+# Take over BEGIN so per-test rollbacks work (see SQLAlchemy's SQLite dialect docs).
+@event.listens_for(engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
 
-@pytest_asyncio.fixture(autouse=True)
+@event.listens_for(engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
 async def setup_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
 
 
 @pytest_asyncio.fixture
 async def db():
-    async with TestSessionLocal() as session:
+    # Each test runs inside one outer transaction that is rolled back afterwards;
+    # commits made by the app only release SAVEPOINTs within it.
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
         yield session
+        await session.close()
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def base_client():
+    # The transport holds no per-test state — build it once and swap the DB per test
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
 
 
 @pytest_asyncio.fixture
-async def client(db: AsyncSession):
+async def client(base_client: AsyncClient, db: AsyncSession):
     async def override_get_db():
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
-        yield c
+    yield base_client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def seed_password_hash() -> str:
+    # bcrypt is deliberately slow — hash once for the whole run
+    return hash_password("pass123")
+
+
+@pytest_asyncio.fixture
+async def seeded_user(db: AsyncSession, seed_password_hash: str) -> tuple[int, str]:
+    """A user with a profile inserted directly through the ORM. Returns (user_id, token)."""
+    bmr = calculate_bmr(175.0, 75.0, 30, Gender.male)
+    tdee = calculate_tdee(bmr, ActivityLevel.moderate)
+    user = User(email="user@test.com", password_hash=seed_password_hash)
+    user.profile = Profile(
+        height=175.0,
+        weight=75.0,
+        age=30,
+        gender=Gender.male,
+        activity_level=ActivityLevel.moderate,
+        goal=Goal.maintain,
+        bmr=bmr,
+        tdee=tdee,
+        daily_target=calculate_daily_target(tdee, Goal.maintain),
+    )
+    db.add(user)
+    await db.commit()
+    return user.id, create_access_token(user.id)
@@ -1,5 +1,11 @@
+import time
+
 import pytest
 
+from app.core import security
+from app.core.config import settings
+from app.core.security import create_access_token, decode_token
+
 
 @pytest.mark.asyncio
 async def test_register_success(client):
@@ -34,3 +40,18 @@ async def test_login_wrong_password(client):
 async def test_login_unknown_email(client):
     res = await client.post("/auth/login", json={"email": "nobody@test.com", "password": "x"})
     assert res.status_code == 401
+
+
+def test_decode_token_roundtrip():
+    token = create_access_token(42)
+    assert decode_token(token) == 42
+    assert decode_token("not-a-token") is None
+
+
+def test_decode_token_rejects_expired_cached_token(monkeypatch):
+    token = create_access_token(42)
+    assert decode_token(token) == 42  # now cached
+
+    expired = time.time() + settings.JWT_EXPIRE_MINUTES * 60 + 1
+    monkeypatch.setattr(security.time, "time", lambda: expired)
+    assert decode_token(token) is None
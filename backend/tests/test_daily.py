@@ -1,20 +1,17 @@
 import pytest
+import pytest_asyncio
 from datetime import date
 
-PROFILE_PAYLOAD = {
-    "height": 175.0,
-    "weight": 75.0,
-    "age": 30,
-    "gender": "male",
-    "activity_level": "moderate",
-    "goal": "maintain",
-}
+from sqlalchemy import event
 
+from app.db.models import DailyStatus
+from app.services.daily import calculate_status, estimate_exercise_calories
 
-async def _setup(client) -> str:
-    res = await client.post("/auth/register", json={"email": "user@test.com", "password": "pass123"})
-    token = res.json()["access_token"]
-    await client.post("/profile", json=PROFILE_PAYLOAD, headers={"Authorization": f"Bearer {token}"})
+
+@pytest_asyncio.fixture
+async def authed_token(seeded_user) -> str:
+    """A registered user with a profile, ready for /daily calls."""
+    _, token = seeded_user
     return token
 
 
@@ -22,14 +19,15 @@ async def _setup(client) -> str:
 async def test_get_daily_requires_profile(client):
     res = await client.post("/auth/register", json={"email": "user@test.com", "password": "pass123"})
     token = res.json()["access_token"]
-    res = await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
+    headers = {"Authorization": f"Bearer {token}"}
+    res = await client.get("/daily", headers=headers)
     assert res.status_code == 400
 
 
 @pytest.mark.asyncio
-async def test_get_daily_creates_log(client):
-    token = await _setup(client)
-    res = await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
+async def test_get_daily_creates_log(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
+    res = await client.get("/daily", headers=headers)
     assert res.status_code == 200
     data = res.json()
     assert data["total_consumed"] == 0.0
@@ -37,65 +35,170 @@ async def test_get_daily_creates_log(client):
 
 
 @pytest.mark.asyncio
-async def test_get_daily_is_idempotent(client):
+async def test_get_daily_is_idempotent(client, authed_token):
     """Calling GET /daily twice must not create duplicate logs."""
-    token = await _setup(client)
-    r1 = await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
-    r2 = await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
+    headers = {"Authorization": f"Bearer {authed_token}"}
+    r1 = await client.get("/daily", headers=headers)
+    r2 = await client.get("/daily", headers=headers)
     assert r1.json()["id"] == r2.json()["id"]
 
 
 @pytest.mark.asyncio
-async def test_add_food_updates_totals(client):
-    token = await _setup(client)
+async def test_add_food_updates_totals(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
     res = await client.post(
         "/daily/food",
         json={"name": "Apple", "calories": 95, "input_type": "structured"},
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
     )
     assert res.status_code == 201
 
-    log = await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
+    log = await client.get("/daily", headers=headers)
     assert log.json()["total_consumed"] == 95.0
 
 
 @pytest.mark.asyncio
-async def test_multiple_food_entries_accumulate(client):
-    token = await _setup(client)
+async def test_multiple_food_entries_accumulate(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
     for cal in [100, 200, 300]:
         await client.post(
             "/daily/food",
             json={"name": "item", "calories": cal, "input_type": "structured"},
-            headers={"Authorization": f"Bearer {token}"},
+            headers=headers,
         )
-    log = await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
+    log = await client.get("/daily", headers=headers)
     assert log.json()["total_consumed"] == 600.0
 
 
 @pytest.mark.asyncio
-async def test_status_surplus(client):
-    token = await _setup(client)
+async def test_status_surplus(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
     await client.post(
         "/daily/food",
         json={"name": "Big meal", "calories": 9000, "input_type": "structured"},
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
     )
-    log = await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
+    log = await client.get("/daily", headers=headers)
     assert log.json()["status"] == "surplus"
 
 
 @pytest.mark.asyncio
-async def test_status_deficit(client):
-    token = await _setup(client)
+async def test_status_deficit(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
     # No food logged => net_calories = 0, which is way below daily_target => deficit
-    log = await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
-    assert log.json()["status"] == "maintenance"  # 0 net, no entries yet
+    log = await client.get("/daily", headers=headers)
+    assert log.json()["status"] == "deficit"
 
 
 @pytest.mark.asyncio
-async def test_history_returns_logs(client):
-    token = await _setup(client)
-    await client.get("/daily", headers={"Authorization": f"Bearer {token}"})
-    res = await client.get("/daily/history", headers={"Authorization": f"Bearer {token}"})
+async def test_history_returns_logs(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
+    await client.get("/daily", headers=headers)
+    res = await client.get("/daily/history", headers=headers)
     assert res.status_code == 200
     assert len(res.json()) >= 1
+    assert res.json()[0]["date"] == date.today().isoformat()
+    assert res.json()[0]["status"] == "deficit"
+
+
+@pytest.mark.asyncio
+async def test_get_daily_query_count_is_constant(client, db, authed_token):
+    """GET /daily must not issue per-entry queries (N+1)."""
+    headers = {"Authorization": f"Bearer {authed_token}"}
+    for cal in [100, 200, 300]:
+        await client.post(
+            "/daily/food",
+            json={"name": "item", "calories": cal, "input_type": "structured"},
+            headers=headers,
+        )
+    await client.post("/daily/exercise", json={"type": "running", "duration_min": 30}, headers=headers)
+    db.expunge_all()  # force a cold load, as a fresh request session would see
+
+    selects = []
+    sync_engine = db.get_bind().engine
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):  # ignore the fixture's SAVEPOINTs
+            selects.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", count)
+    try:
+        res = await client.get("/daily", headers=headers)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count)
+
+    assert len(res.json()["food_entries"]) == 3
+    assert len(res.json()["exercise_entries"]) == 1
+    # user+profile, daily log, food_entries selectin, exercise_entries selectin
+    assert len(selects) == 4
+
+
+@pytest.mark.asyncio
+async def test_delete_food_updates_totals(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
+    res = await client.post(
+        "/daily/food",
+        json={"name": "Apple", "calories": 95, "input_type": "structured"},
+        headers=headers,
+    )
+    entry_id = res.json()["id"]
+
+    res = await client.delete(f"/daily/food/{entry_id}", headers=headers)
+    assert res.status_code == 204
+
+    log = await client.get("/daily", headers=headers)
+    assert log.json()["total_consumed"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_delete_food_not_found(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
+    res = await client.delete("/daily/food/999", headers=headers)
+    assert res.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_add_exercise_updates_totals(client, authed_token):
+    headers = {"Authorization": f"Bearer {authed_token}"}
+    res = await client.post(
+        "/daily/exercise",
+        json={"type": "running", "duration_min": 30},
+        headers=headers,
+    )
+    assert res.status_code == 201
+    # 9.8 MET × 75 kg × 0.5 h
+    assert res.json()["calories_burned"] == 367.5
+    assert res.json()["duration"] == 30
+
+    log = await client.get("/daily", headers=headers)
+    assert log.json()["total_burned"] == 367.5
+    assert log.json()["net_calories"] == -367.5
+
+
+def test_estimate_exercise_calories_known_type():
+    # 9.8 MET × 75 kg × 0.5 h
+    assert estimate_exercise_calories("running", 30, 75.0) == 367.5
+
+
+def test_estimate_exercise_calories_unknown_type_uses_default():
+    # Falls back to "other" = 4.0 MET
+    assert estimate_exercise_calories("underwater_basket_weaving", 60, 80.0) == 320.0
+
+
+def test_estimate_exercise_calories_rounds_half_up():
+    # 3.0 MET × 1 kg × 5/60 h = 0.25 exactly
+    assert estimate_exercise_calories("pilates", 5, 1.0) == 0.3
+
+
+@pytest.mark.parametrize(
+    "net, expected",
+    [
+        (1899, DailyStatus.deficit),
+        (1900, DailyStatus.maintenance),
+        (2000, DailyStatus.maintenance),
+        (2100, DailyStatus.maintenance),
+        (2101, DailyStatus.surplus),
+    ],
+)
+def test_calculate_status_tolerance_boundaries(net, expected):
+    assert calculate_status(net, 2000) == expected
@@ -18,8 +18,9 @@ async def _register(client) -> str:
 @pytest.mark.asyncio
 async def test_create_profile(client):
     token = await _register(client)
+    headers = {"Authorization": f"Bearer {token}"}
     res = await client.post(
-        "/profile", json=PROFILE_PAYLOAD, headers={"Authorization": f"Bearer {token}"}
+        "/profile", json=PROFILE_PAYLOAD, headers=headers
     )
     assert res.status_code == 201
     data = res.json()
@@ -33,16 +34,18 @@ async def test_create_profile(client):
 @pytest.mark.asyncio
 async def test_create_profile_duplicate(client):
     token = await _register(client)
-    await client.post("/profile", json=PROFILE_PAYLOAD, headers={"Authorization": f"Bearer {token}"})
-    res = await client.post("/profile", json=PROFILE_PAYLOAD, headers={"Authorization": f"Bearer {token}"})
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.post("/profile", json=PROFILE_PAYLOAD, headers=headers)
+    res = await client.post("/profile", json=PROFILE_PAYLOAD, headers=headers)
     assert res.status_code == 409
 
 
 @pytest.mark.asyncio
 async def test_get_profile(client):
     token = await _register(client)
-    await client.post("/profile", json=PROFILE_PAYLOAD, headers={"Authorization": f"Bearer {token}"})
-    res = await client.get("/profile", headers={"Authorization": f"Bearer {token}"})
+    headers = {"Authorization": f"Bearer {token}"}
+    await client.post("/profile", json=PROFILE_PAYLOAD, headers=headers)
+    res = await client.get("/profile", headers=headers)
     assert res.status_code == 200
     assert res.json()["height"] == 175.0
 
@@ -50,7 +53,8 @@ async def test_get_profile(client):
 @pytest.mark.asyncio
 async def test_get_profile_not_found(client):
     token = await _register(client)
-    res = await client.get("/profile", headers={"Authorization": f"Bearer {token}"})
+    headers = {"Authorization": f"Bearer {token}"}
+    res = await client.get("/profile", headers=headers)
     assert res.status_code == 404
 
 